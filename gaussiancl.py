@@ -77,7 +77,7 @@ def _gettfm(name):
 def _relerr(dx, x):
     '''compute the relative error max(|dx/x|)'''
     q = np.divide(dx, x, where=(dx != 0), out=np.zeros_like(dx))
-    return np.fabs(q).max()
+    return np.fabs(q, out=q).max()
 
 
 def gcllim(cl, tfm, pars=(), *, inv=False, der=False):
@@ -126,15 +126,22 @@ def gaussiancl(cl, tfm, pars=(), *, gl=None, n=None, cltol=1e-5, gltol=1e-5,
 
     if gl is None:
         gl = corrtocl(tfm(cltocorr(cl), *pars, inv=True))
-    elif monopole is not None:
+        if monopole is not None:
+            gl[0] = monopole
+    elif monopole is not None and gl[0] != monopole:
         gl = np.copy(gl)
-    if monopole is not None:
         gl[0] = monopole
 
-    gt = cltocorr(np.pad(gl, (0, k)))
-    fl = corrtocl(tfm(gt, *pars))[:m] - cl
-    if monopole is not None:
-        fl[0] = 0
+    # modes held fixed by the monopole constraint, empty if there is none
+    fix = slice(0, 1 if monopole is not None else 0)
+
+    # zero-padded work array for the transforms; the padding stays zero
+    pad = np.zeros(m+k)
+    pad[:m] = gl
+    gt = cltocorr(pad)
+    fl = corrtocl(tfm(gt, *pars))[:m]
+    fl -= cl
+    fl[fix] = 0
     clerr = _relerr(fl, cl)
 
     info = 0
@@ -144,22 +151,30 @@ def gaussiancl(cl, tfm, pars=(), *, gl=None, n=None, cltol=1e-5, gltol=1e-5,
         if info > 0:
             break
 
-        ft = cltocorr(np.pad(fl, (0, k)))
+        pad[:m] = fl
+        ft = cltocorr(pad)
         dt = tfm(gt, *pars, der=True)
-        xl = -corrtocl(ft/dt)[:m]
-        if monopole is not None:
-            xl[0] = 0
+        np.divide(ft, dt, out=ft)
+        xl = corrtocl(ft)[:m]
+        np.negative(xl, out=xl)
+        xl[fix] = 0
+
+        # the transform is linear, so the step in gt is halved along with xl
+        pad[:m] = xl
+        xt = cltocorr(pad)
 
         while True:
-            gl_ = gl + xl
-            gt_ = cltocorr(np.pad(gl_, (0, k)))
-            fl_ = corrtocl(tfm(gt_, *pars))[:m] - cl
-            if monopole is not None:
-                fl_[0] = 0
+            gt_ = gt + xt
+            fl_ = corrtocl(tfm(gt_, *pars))[:m]
+            fl_ -= cl
+            fl_[fix] = 0
             clerr_ = _relerr(fl_, cl)
             if clerr_ <= clerr:
                 break
             xl /= 2
+            xt /= 2
+
+        gl_ = gl + xl
 
         if _relerr(xl, gl) <= gltol:
             info |= 2
@@ -169,31 +184,73 @@ def gaussiancl(cl, tfm, pars=(), *, gl=None, n=None, cltol=1e-5, gltol=1e-5,
     return gl, info, clerr, i
 
 
+def _lognormal(x, a):
+    '''lognormal transform of correlations'''
+    return np.expm1(x)*a
+
+
+def _lognormal_der(x, a):
+    '''derivative of the lognormal transform'''
+    return np.exp(x)*a
+
+
+def _lognormal_inv(x, a):
+    '''inverse lognormal transform of correlations'''
+    y = np.divide(x, a)
+    return np.log1p(y, out=y) if np.ndim(y) else np.log1p(y)
+
+
+def _lognormal_inv_der(x, a):
+    '''derivative of the inverse lognormal transform'''
+    y = np.add(x, a, dtype=np.result_type(x, a, 1.0))
+    return np.reciprocal(y, out=y) if np.ndim(y) else 1/y
+
+
+# lognormal kernels for (inv, der)
+_LOGNORMAL = {
+    (False, False): _lognormal,
+    (False, True): _lognormal_der,
+    (True, False): _lognormal_inv,
+    (True, True): _lognormal_inv_der,
+}
+
+
 def lognormal(x, alpha, alpha2=None, *, inv=False, der=False):
     '''lognormal correlations'''
     if alpha2 is None:
         alpha2 = alpha
-    if not inv:
-        if not der:
-            return np.expm1(x)*(alpha*alpha2)
-        else:
-            return np.exp(x)*(alpha*alpha2)
-    else:
-        if not der:
-            return np.log1p(x/(alpha*alpha2))
-        else:
-            return 1/(x + alpha*alpha2)
+    return _LOGNORMAL[bool(inv), bool(der)](x, alpha*alpha2)
+
+
+def _lognormal_normal(x, alpha):
+    '''lognormal cross normal transform of correlations'''
+    return x*alpha
+
+
+def _lognormal_normal_der(x, alpha):
+    '''derivative of the lognormal cross normal transform'''
+    return alpha
+
+
+def _lognormal_normal_inv(x, alpha):
+    '''inverse lognormal cross normal transform'''
+    return x*np.reciprocal(alpha, dtype=np.result_type(x, alpha, 1.0))
+
+
+def _lognormal_normal_inv_der(x, alpha):
+    '''derivative of the inverse lognormal cross normal transform'''
+    return 1/alpha
+
+
+# lognormal cross normal kernels for (inv, der)
+_LOGNORMAL_NORMAL = {
+    (False, False): _lognormal_normal,
+    (False, True): _lognormal_normal_der,
+    (True, False): _lognormal_normal_inv,
+    (True, True): _lognormal_normal_inv_der,
+}
 
 
 def lognormal_normal(x, alpha, *, inv=False, der=False):
     '''lognormal cross normal correlations'''
-    if not inv:
-        if not der:
-            return x*alpha
-        else:
-            return alpha
-    else:
-        if not der:
-            return x/alpha
-        else:
-            return 1/alpha
+    return _LOGNORMAL_NORMAL[bool(inv), bool(der)](x, alpha)